@@ -0,0 +1,48 @@
+"""Measure serial versus parallel row extraction in :func:`parse_table`.
+
+Run with ``uv run python benchmarks/parallel.py [ROWS]``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from html_table_scraper import parse_table
+
+
+def _make_html(rows: int) -> str:
+    """Build a wide table with links, footnotes and ragged rows."""
+
+    body = "".join(
+        f"<tr><td><a href='/r{i}'>Row {i}</a><sup>[{i % 7}]</sup></td>"
+        f"<td>{i * 1.5:.2f}</td><td>first<br/>second</td>"
+        + "<td>extra</td>" * (i % 2)
+        + "</tr>"
+        for i in range(rows)
+    )
+    header = "<tr><th>Name</th><th>Value</th><th>Note</th></tr>"
+    return f"<table>{header}{body}</table>"
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    table = BeautifulSoup(_make_html(rows), "lxml").find("table")
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    mode = "enabled" if gil else "disabled"
+    print(f"{rows} rows, {os.cpu_count()} CPUs, GIL {mode}")
+
+    baseline = None
+    for workers in (None, 2, 4, 8):
+        start = time.perf_counter()
+        parse_table(table, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers}: {elapsed:.2f} s ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
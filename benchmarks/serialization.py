@@ -0,0 +1,78 @@
+"""Compare the compact serialization format against plain pickle.
+
+Run with ``uv run python benchmarks/serialization.py``.
+"""
+
+from __future__ import annotations
+
+import pickle
+import timeit
+from typing import Any, Callable
+
+import pandas as pd
+
+from html_table_scraper import (
+    Table,
+    TableCell,
+    dumps_cells,
+    dumps_table,
+    loads_cells,
+    loads_table,
+)
+
+ROWS = 100_000
+COLS = 8
+CELLS = 50_000
+REPEAT = 5
+
+
+def _make_table() -> Table:
+    """Build a string table resembling a scraped page with repetitive values."""
+
+    rows = [
+        [f"{row % 500}", f"Region {row % 12}", f"{row * 1.5:.2f}%"]
+        + [f"note {(row + col) % 40}" for col in range(COLS - 3)]
+        for row in range(ROWS)
+    ]
+    return Table(rows, columns=[f"Col{col}" for col in range(COLS)], title="Bench")
+
+
+def _make_cells() -> list[TableCell]:
+    """Build cells with links and footnote markers."""
+
+    cells = []
+    for index in range(CELLS):
+        name = f"Item {index % 1000}"
+        link = {"href": f"/wiki/Item_{index % 1000}", "text": name}
+        cells.append(TableCell(text=name, links=[link], sups=[f"[{index % 10}]"]))
+    return cells
+
+
+def _time(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+def _report(name: str, obj: Any, dumps: Callable, loads: Callable) -> None:
+    data = dumps(obj)
+    print(
+        f"{name:<24} {len(data) / 1e6:>8.2f} MB"
+        f" {_time(lambda: dumps(obj)):>10.1f} ms"
+        f" {_time(lambda: loads(data)):>10.1f} ms"
+    )
+
+
+def main() -> None:
+    table = _make_table()
+    plain = pd.DataFrame(table)
+    cells = _make_cells()
+
+    print(f"pandas {pd.__version__}; {ROWS} x {COLS} table, {CELLS} cells")
+    print(f"{'format':<24} {'size':>11} {'dumps':>13} {'loads':>13}")
+    _report("table: pickle", plain, pickle.dumps, pickle.loads)
+    _report("table: compact", table, dumps_table, loads_table)
+    _report("cells: pickle", cells, pickle.dumps, pickle.loads)
+    _report("cells: compact", cells, dumps_cells, loads_cells)
+
+
+if __name__ == "__main__":
+    main()
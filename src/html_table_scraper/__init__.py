@@ -1,5 +1,13 @@
 """Convenient imports for HTML table scraping utilities."""
 
+from .serialization import (
+    dumps_cells,
+    dumps_table,
+    load_shared_table,
+    loads_cells,
+    loads_table,
+    share_table,
+)
 from .table import (
     Table,
     TableCell,
@@ -15,6 +23,12 @@ __all__ = [
     "Table",
     "TableCell",
     "parse_table",
+    "dumps_table",
+    "loads_table",
+    "dumps_cells",
+    "loads_cells",
+    "share_table",
+    "load_shared_table",
     "_parse_element",
     "_parse_cell",
     "_parse_row",
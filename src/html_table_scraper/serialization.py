@@ -0,0 +1,267 @@
+"""Compact binary serialization for :class:`Table` and :class:`TableCell` objects.
+
+Tables produced by :func:`parse_table` hold only strings, and those strings are
+often highly repetitive.  The formats below store every distinct string once in
+a shared string table and refer to it through packed ``uint32`` codes, which
+keeps payloads small when results are shipped between processes.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .table import Table, TableCell
+
+_TABLE_MAGIC = b"HTST"
+_CELLS_MAGIC = b"HTSC"
+_VERSION = 1
+
+# magic, version, has_title, number of rows, number of columns
+_TABLE_HEADER = struct.Struct("<4sBBQI")
+# magic, version, number of cells, number of links, number of superscripts
+_CELLS_HEADER = struct.Struct("<4sBIII")
+_COUNT = struct.Struct("<I")
+
+# Code used for ``href`` values that are ``None`` (links without an href).
+_NO_STRING = 0xFFFFFFFF
+
+
+def _pack_strings(strings: Sequence[str]) -> bytes:
+    """Pack a list of strings as a count, a length array and a UTF-8 blob."""
+
+    encoded = [string.encode("utf-8") for string in strings]
+    lengths = np.fromiter(map(len, encoded), dtype="<u4", count=len(encoded))
+    return _COUNT.pack(len(encoded)) + lengths.tobytes() + b"".join(encoded)
+
+
+def _unpack_strings(buffer: memoryview, offset: int) -> Tuple[List[str], int]:
+    """Inverse of :func:`_pack_strings`, returning the strings and new offset."""
+
+    (count,) = _COUNT.unpack_from(buffer, offset)
+    offset += _COUNT.size
+    lengths = np.frombuffer(buffer, dtype="<u4", count=count, offset=offset)
+    offset += lengths.nbytes
+    ends = np.cumsum(lengths, dtype=np.int64) + offset
+    starts = ends - lengths
+    strings = [
+        str(buffer[start:end], "utf-8")
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+    return strings, int(ends[-1]) if count else offset
+
+
+def _unpack_codes(
+    buffer: memoryview, offset: int, count: int
+) -> Tuple[np.ndarray, int]:
+    """Read ``count`` packed ``uint32`` codes starting at ``offset``."""
+
+    codes = np.frombuffer(buffer, dtype="<u4", count=count, offset=offset)
+    return codes, offset + codes.nbytes
+
+
+def _is_packable(table: Table) -> bool:
+    """Return whether ``table`` can be stored in the compact table format."""
+
+    if not isinstance(table.index, pd.RangeIndex) or table.index.start != 0:
+        return False
+    if table.index.step != 1:
+        return False
+    if not all(isinstance(column, str) for column in table.columns):
+        return False
+    title = getattr(table, "title", None)
+    if title is not None and not isinstance(title, str):
+        return False
+    for _, column in table.items():
+        if isinstance(column.dtype, pd.StringDtype):
+            if column.hasnans:
+                return False
+        elif not all(isinstance(value, str) for value in column):
+            return False
+    return True
+
+
+def dumps_table(table: Table) -> bytes:
+    """Serialize a string-valued :class:`Table` into the compact binary format.
+
+    Args:
+        table: Table whose column labels and cells are all strings and whose
+            index is the default ``RangeIndex``.
+
+    Returns:
+        Serialized bytes that can be read back with :func:`loads_table`.
+
+    Raises:
+        ValueError: If the table holds values the format cannot represent.
+    """
+
+    if not _is_packable(table):
+        raise ValueError("Only string tables with a default index can be packed")
+
+    title = getattr(table, "title", None)
+    n_rows, n_cols = table.shape
+    codes, uniques = pd.factorize(table.to_numpy(dtype=object).ravel())
+
+    parts = [
+        _TABLE_HEADER.pack(_TABLE_MAGIC, _VERSION, title is not None, n_rows, n_cols),
+        _pack_strings([title] if title is not None else []),
+        _pack_strings(list(table.columns)),
+        _pack_strings(uniques.tolist()),
+        codes.astype("<u4").tobytes(),
+    ]
+    return b"".join(parts)
+
+
+def loads_table(data: bytes | bytearray | memoryview) -> Table:
+    """Deserialize a :class:`Table` written by :func:`dumps_table`."""
+
+    buffer = memoryview(data).cast("B")
+    magic, version, has_title, n_rows, n_cols = _TABLE_HEADER.unpack_from(buffer)
+    if magic != _TABLE_MAGIC or version != _VERSION:
+        raise ValueError("Data is not a serialized Table")
+    offset = _TABLE_HEADER.size
+
+    titles, offset = _unpack_strings(buffer, offset)
+    columns, offset = _unpack_strings(buffer, offset)
+    uniques, offset = _unpack_strings(buffer, offset)
+    codes, offset = _unpack_codes(buffer, offset, n_rows * n_cols)
+
+    values = np.array(uniques, dtype=object)[codes].reshape(n_rows, n_cols)
+    title = titles[0] if has_title else None
+    if columns:
+        return Table(values, columns=columns, title=title)
+    return Table(values, title=title)
+
+
+class _StringTable:
+    """Assign stable integer codes to strings, storing each distinct one once."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, string: Optional[str]) -> int:
+        if string is None:
+            return _NO_STRING
+        code = self.codes.get(string)
+        if code is None:
+            code = self.codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+
+
+def dumps_cells(cells: Sequence[TableCell]) -> bytes:
+    """Serialize a batch of :class:`TableCell` objects with a shared string table.
+
+    Args:
+        cells: Cells to serialize. Each link must be a mapping with ``href``
+            and ``text`` keys, as produced by :meth:`TableCell.from_soup`.
+
+    Returns:
+        Serialized bytes that can be read back with :func:`loads_cells`.
+    """
+
+    strings = _StringTable()
+    texts: List[int] = []
+    link_counts: List[int] = []
+    sup_counts: List[int] = []
+    link_codes: List[int] = []
+    sup_codes: List[int] = []
+
+    for cell in cells:
+        texts.append(strings.add(cell.text))
+        link_counts.append(len(cell.links))
+        sup_counts.append(len(cell.sups))
+        for link in cell.links:
+            link_codes.append(strings.add(link["href"]))
+            link_codes.append(strings.add(link["text"]))
+        sup_codes.extend(strings.add(sup) for sup in cell.sups)
+
+    parts = [
+        _CELLS_HEADER.pack(
+            _CELLS_MAGIC, _VERSION, len(texts), len(link_codes) // 2, len(sup_codes)
+        ),
+        _pack_strings(strings.strings),
+    ]
+    for codes in (texts, link_counts, sup_counts, link_codes, sup_codes):
+        parts.append(np.asarray(codes, dtype="<u4").tobytes())
+    return b"".join(parts)
+
+
+def loads_cells(data: bytes | bytearray | memoryview) -> List[TableCell]:
+    """Deserialize a batch of cells written by :func:`dumps_cells`."""
+
+    buffer = memoryview(data).cast("B")
+    magic, version, n_cells, n_links, n_sups = _CELLS_HEADER.unpack_from(buffer)
+    if magic != _CELLS_MAGIC or version != _VERSION:
+        raise ValueError("Data is not a serialized TableCell batch")
+    offset = _CELLS_HEADER.size
+
+    strings, offset = _unpack_strings(buffer, offset)
+    texts, offset = _unpack_codes(buffer, offset, n_cells)
+    link_counts, offset = _unpack_codes(buffer, offset, n_cells)
+    sup_counts, offset = _unpack_codes(buffer, offset, n_cells)
+    link_codes, offset = _unpack_codes(buffer, offset, 2 * n_links)
+    sup_codes, offset = _unpack_codes(buffer, offset, n_sups)
+
+    # Clamping maps the ``_NO_STRING`` sentinel onto the trailing ``None``.
+    lookup = np.array(strings + [None], dtype=object)
+    text_values = lookup[np.minimum(texts, len(strings))].tolist()
+    link_values = lookup[np.minimum(link_codes, len(strings))].tolist()
+    sup_values = lookup[np.minimum(sup_codes, len(strings))].tolist()
+
+    cells: List[TableCell] = []
+    link_pos = sup_pos = 0
+    for text, link_count, sup_count in zip(
+        text_values, link_counts.tolist(), sup_counts.tolist()
+    ):
+        links = [
+            {"href": link_values[index], "text": link_values[index + 1]}
+            for index in range(link_pos, link_pos + 2 * link_count, 2)
+        ]
+        link_pos += 2 * link_count
+        sups = sup_values[sup_pos : sup_pos + sup_count]
+        sup_pos += sup_count
+        cells.append(TableCell(text=text, links=links, sups=sups))
+    return cells
+
+
+def share_table(table: Table) -> str:
+    """Write ``table`` into a new shared memory block and return the block name.
+
+    The block outlives the calling process, so a worker can return just the
+    name to its parent, which then reads and frees it with
+    :func:`load_shared_table`.
+    """
+
+    data = dumps_table(table)
+    if sys.version_info >= (3, 13):
+        shm = SharedMemory(create=True, size=max(len(data), 1), track=False)
+    else:  # pragma: no cover - depends on the Python version
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        # Stop this process's resource tracker from unlinking the block when
+        # the worker exits; ownership passes to whoever loads it.
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    try:
+        shm.buf[: len(data)] = data
+        return shm.name
+    finally:
+        shm.close()
+
+
+def load_shared_table(name: str) -> Table:
+    """Read a table written by :func:`share_table` and free its shared memory."""
+
+    shm = SharedMemory(name=name)
+    try:
+        # Copy out of the block so that no views into it outlive ``close()``.
+        return loads_table(bytes(shm.buf))
+    finally:
+        shm.close()
+        shm.unlink()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
+import math
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 import pandas as pd
 from bs4 import BeautifulSoup, Tag
@@ -86,6 +90,8 @@ class TableCell:
 class Table(pd.DataFrame):
     """DataFrame subclass with an optional title for display."""
 
+    _metadata = ["title"]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Create a ``Table`` optionally including a title."""
 
@@ -95,6 +101,10 @@ class Table(pd.DataFrame):
         super(Table, self).__init__(*args, **kwargs)
         self.title: Optional[str] = title
 
+    @property
+    def _constructor(self) -> type["Table"]:
+        return Table
+
     def pretty_print(self) -> None:
         """Display the table using IPython rich HTML."""
 
@@ -137,15 +147,104 @@ def _parse_cell(soup: Optional[Tag]) -> str:
     return parsed.replace("\n", " ")
 
 
-def _parse_row(soup: Tag) -> List[str]:
-    """Parse a table row into a list of cell strings."""
-    return [_parse_cell(cell) for cell in soup.find_all(["th", "td"], recursive=False)]
+def _parse_row(soup: Tag, indices: Optional[Sequence[int]] = None) -> List[str]:
+    """Parse a table row into a list of cell strings.
+
+    When ``indices`` is given, only the cells at those positions are parsed and
+    missing cells are returned as empty strings.
+    """
+
+    cells = soup.find_all(["th", "td"], recursive=False)
+    if indices is None:
+        return [_parse_cell(cell) for cell in cells]
+    return [
+        _parse_cell(cells[index]) if index < len(cells) else "" for index in indices
+    ]
+
+
+def _iter_rows(table: Tag) -> Iterator[Tag]:
+    """Lazily yield the ``<tr>`` rows of a table in document order."""
+
+    for child in table.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name == "tr":
+            yield child
+        elif child.name in ("thead", "tbody", "tfoot"):
+            for row in child.children:
+                if isinstance(row, Tag) and row.name == "tr":
+                    yield row
+
+
+def _parse_row_chunk(html: str, indices: Optional[Sequence[int]]) -> List[List[str]]:
+    """Parse the serialized ``<tr>`` rows of a chunk in a worker process."""
+
+    soup = BeautifulSoup(html, "html.parser")
+    return [
+        _parse_row(row, indices)
+        for row in soup.children
+        if isinstance(row, Tag) and row.name == "tr"
+    ]
+
+
+def _parse_rows_parallel(
+    rows: List[Tag], indices: Optional[Sequence[int]], workers: int
+) -> List[List[str]]:
+    """Parse rows in ordered chunks spread across ``workers`` workers.
+
+    Free-threaded CPython builds parse the row tags directly in a thread pool.
+    Otherwise the GIL would serialize that work, so each chunk is shipped to a
+    process pool as raw row HTML instead.
+    """
+
+    chunk_size = max(1, math.ceil(len(rows) / (workers * 4)))
+    chunks = [
+        rows[start : start + chunk_size] for start in range(0, len(rows), chunk_size)
+    ]
+
+    executor: Executor
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        executor = ThreadPoolExecutor(max_workers=workers)
+        with executor:
+            parsed = executor.map(
+                lambda chunk: [_parse_row(row, indices) for row in chunk], chunks
+            )
+            return [row for chunk in parsed for row in chunk]
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    with executor:
+        parsed = executor.map(
+            _parse_row_chunk,
+            ["".join(str(row) for row in chunk) for chunk in chunks],
+            itertools.repeat(indices),
+        )
+        return [row for chunk in parsed for row in chunk]
+
+
+def _resolve_columns(columns: Sequence[int | str], header: List[str]) -> List[int]:
+    """Map column names or positions onto cell indices within a row."""
+
+    indices: List[int] = []
+    for column in columns:
+        if isinstance(column, str):
+            if column not in header:
+                raise KeyError(f"Column {column!r} not found in table header")
+            indices.append(header.index(column))
+        elif column < 0:
+            raise ValueError(f"Column index must be non-negative, got {column}")
+        else:
+            indices.append(column)
+    return indices
 
 
 def parse_table(
     table: Optional[Tag],
     first_row_as_col_titles: bool = True,
     ignore_first_row: bool = False,
+    columns: Optional[Sequence[int | str]] = None,
+    max_rows: Optional[int] = None,
+    row_filter: Optional[Callable[[Tag], bool]] = None,
+    workers: Optional[int] = None,
 ) -> Table:
     """Convert an HTML ``<table>`` tag into a :class:`Table`.
 
@@ -153,44 +252,75 @@ def parse_table(
         table: BeautifulSoup ``<table>`` tag to convert.
         first_row_as_col_titles: Whether to use the first row as column names.
         ignore_first_row: Whether to skip the first row entirely.
+        columns: Header names or cell positions to extract. Only these cells
+            are parsed; other cells are never converted to text.
+        max_rows: Maximum number of data rows to extract. Rows past the limit
+            are not visited.
+        row_filter: Predicate called with each data ``<tr>`` tag; rows for
+            which it returns ``False`` are skipped before any text extraction.
+        workers: Number of workers used to extract cell text in parallel.
+            Rows are split into ordered chunks and parsed in a thread pool on
+            free-threaded CPython or a process pool otherwise. ``None`` or
+            ``1`` parses serially.
 
     Returns:
         Parsed ``Table`` instance containing the data.
     """
 
-    if table is not None:
-        rows: List[Tag] = []
-        for child in table.find_all(["tr", "thead", "tbody", "tfoot"], recursive=False):
-            if child.name == "tr":
-                rows.append(child)
-            else:
-                rows.extend(child.find_all("tr", recursive=False))
+    if max_rows is not None and max_rows < 0:
+        raise ValueError(f"max_rows must be non-negative, got {max_rows}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if isinstance(columns, str):
+        raise TypeError("columns must be a sequence of names or indices, not a str")
 
+    if table is not None:
+        rows: Iterator[Tag] = _iter_rows(table)
         if ignore_first_row:
-            rows = rows[1:]
-
-        if len(rows) > 0:
-            row_lists: List[List[str]] = []
-            if first_row_as_col_titles:
-                columns = _parse_row(rows[0])
-                for row in rows[1:]:
-                    row_lists.append(_parse_row(row))
-            else:
-                columns: List[str] = []
-                for row in rows:
-                    row_lists.append(_parse_row(row))
-
-            max_len = max(len(row) for row in [columns] + row_lists)
-
-            def normalize_length(row_list: List[str]) -> List[str]:
-                return row_list + [""] * (max_len - len(row_list))
-
-            columns = normalize_length(columns)
-            for index, row_list in enumerate(row_lists):
-                row_lists[index] = normalize_length(row_list)
-
-            if columns:
-                return Table(row_lists, columns=columns)
-            return Table(row_lists)
+            next(rows, None)
+
+        header: Optional[Tag] = None
+        if first_row_as_col_titles:
+            header = next(rows, None)
+            if header is None:
+                return Table()
+        header_cells = _parse_row(header) if header is not None else []
+
+        indices: Optional[List[int]] = None
+        if columns is not None:
+            indices = _resolve_columns(columns, header_cells)
+
+        if row_filter is not None:
+            rows = filter(row_filter, rows)
+        if max_rows is not None:
+            rows = itertools.islice(rows, max_rows)
+
+        row_lists: List[List[str]]
+        if workers is not None and workers > 1:
+            row_lists = _parse_rows_parallel(list(rows), indices, workers)
+        else:
+            row_lists = [_parse_row(row, indices) for row in rows]
+        if header is None and not row_lists:
+            return Table()
+
+        if indices is not None:
+            titles = [
+                header_cells[index] if index < len(header_cells) else ""
+                for index in indices
+            ]
+            return Table(row_lists, columns=titles)
+
+        max_len = max(len(row) for row in [header_cells] + row_lists)
+
+        def normalize_length(row_list: List[str]) -> List[str]:
+            return row_list + [""] * (max_len - len(row_list))
+
+        header_cells = normalize_length(header_cells)
+        for index, row_list in enumerate(row_lists):
+            row_lists[index] = normalize_length(row_list)
+
+        if header_cells:
+            return Table(row_lists, columns=header_cells)
+        return Table(row_lists)
 
     return Table()
@@ -1,9 +1,13 @@
 """Additional test cases for html_table_scraper utilities."""
 
+import sys
+
 import pandas as pd
+import pytest
 from bs4 import BeautifulSoup
 
 from html_table_scraper import TableCell, _parse_element, parse_table
+from html_table_scraper import table as table_module
 
 
 def test_parse_element_hidden_span_case_insensitive() -> None:
@@ -55,3 +59,95 @@ def test_parse_table_multiple_tbody_sections() -> None:
 
     expected = pd.DataFrame([["1", "2"], ["3", "4"]], columns=["A", "B"])
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parse_table_projects_columns_by_name_and_index(monkeypatch) -> None:
+    """Only the selected cells are parsed when ``columns`` is given."""
+
+    html = """
+    <table>
+        <tr><th>A</th><th>B</th><th>C</th></tr>
+        <tr><td>1</td><td>2</td><td>3</td></tr>
+        <tr><td>4</td></tr>
+    </table>
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    parsed: list[str] = []
+    original = table_module._parse_cell
+
+    def counting_parse_cell(cell):
+        text = original(cell)
+        parsed.append(text)
+        return text
+
+    monkeypatch.setattr(table_module, "_parse_cell", counting_parse_cell)
+    result = parse_table(soup.find("table"), columns=["C", 0])
+
+    expected = pd.DataFrame([["3", "1"], ["", "4"]], columns=["C", "A"])
+    pd.testing.assert_frame_equal(result, expected)
+    assert parsed == ["A", "B", "C", "3", "1", "4"]
+
+
+def test_parse_table_max_rows_and_row_filter() -> None:
+    """``row_filter`` skips rows and ``max_rows`` caps the result."""
+
+    html = """
+    <table>
+        <tr><th>A</th></tr>
+        <tr class="skip"><td>1</td></tr>
+        <tr><td>2</td></tr>
+        <tr><td>3</td></tr>
+        <tr><td>4</td></tr>
+    </table>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    result = parse_table(
+        soup.find("table"),
+        max_rows=2,
+        row_filter=lambda row: "skip" not in row.get("class", []),
+    )
+
+    expected = pd.DataFrame([["2"], ["3"]], columns=["A"])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_parse_table_projection_errors() -> None:
+    """Unknown column names, bare strings and invalid limits are rejected."""
+
+    soup = BeautifulSoup("<table><tr><th>A</th></tr></table>", "lxml")
+    with pytest.raises(TypeError):
+        parse_table(soup.find("table"), columns="A")
+    with pytest.raises(KeyError):
+        parse_table(soup.find("table"), columns=["missing"])
+    with pytest.raises(ValueError):
+        parse_table(soup.find("table"), columns=[-1])
+    with pytest.raises(ValueError):
+        parse_table(soup.find("table"), max_rows=-1)
+    with pytest.raises(ValueError):
+        parse_table(soup.find("table"), workers=0)
+
+
+def test_parse_table_parallel_matches_serial(monkeypatch) -> None:
+    """Parallel extraction keeps row order and ragged-row handling."""
+
+    rows = "".join(
+        f"<tr><td>{i}</td><td>a<br/>{i}<sup>1</sup></td>{'<td>x</td>' * (i % 3)}</tr>"
+        for i in range(50)
+    )
+    html = f"<table><tr><th>N</th><th>V</th></tr>{rows}</table>"
+    table_tag = BeautifulSoup(html, "lxml").find("table")
+
+    pd.testing.assert_frame_equal(
+        parse_table(table_tag, workers=2), parse_table(table_tag)
+    )
+    pd.testing.assert_frame_equal(
+        parse_table(table_tag, columns=[3, "V"], workers=2),
+        parse_table(table_tag, columns=[3, "V"]),
+    )
+
+    # Free-threaded builds parse the row tags in a thread pool instead.
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    pd.testing.assert_frame_equal(
+        parse_table(table_tag, workers=2), parse_table(table_tag)
+    )
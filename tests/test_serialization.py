@@ -0,0 +1,112 @@
+"""Tests for :mod:`html_table_scraper.serialization`."""
+
+from __future__ import annotations
+
+import pickle
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from html_table_scraper import (
+    Table,
+    TableCell,
+    dumps_cells,
+    dumps_table,
+    load_shared_table,
+    loads_cells,
+    loads_table,
+    parse_table,
+    share_table,
+)
+
+
+def _scraped_table() -> Table:
+    html = """
+    <table>
+        <tr><th>Name</th><th>Note</th></tr>
+        <tr><td>Tom &amp; Jerry</td><td>ü<br/>x</td></tr>
+        <tr><td>Tom &amp; Jerry</td></tr>
+    </table>
+    """
+    table = parse_table(BeautifulSoup(html, "lxml").find("table"))
+    table.title = "Cartoons"
+    return table
+
+
+def test_table_round_trip_preserves_title() -> None:
+    """``dumps_table``/``loads_table`` and pickle keep data and title."""
+
+    table = _scraped_table()
+    for restored in (
+        loads_table(dumps_table(table)),
+        pickle.loads(pickle.dumps(table)),
+    ):
+        assert isinstance(restored, Table)
+        assert restored.title == "Cartoons"
+        pd.testing.assert_frame_equal(restored, table)
+
+
+def test_table_round_trip_edge_shapes() -> None:
+    """Empty tables and tables without columns survive a round trip."""
+
+    soup = BeautifulSoup("<table><tr></tr><tr></tr></table>", "lxml")
+    for table in (Table(), parse_table(soup.find("table"))):
+        restored = loads_table(dumps_table(table))
+        assert restored.shape == table.shape
+        assert restored.title is None
+
+
+def test_non_string_tables_are_rejected() -> None:
+    """Tables the compact format cannot hold are rejected but still pickle."""
+
+    table = Table([[1, 2]], columns=["a", "b"], title="Numbers")
+    with pytest.raises(ValueError):
+        dumps_table(table)
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored.title == "Numbers"
+    pd.testing.assert_frame_equal(restored, table)
+
+
+def test_cells_round_trip() -> None:
+    """Cell batches keep their links, missing hrefs and superscripts."""
+
+    html = '<td><a href="/a">A</a><a>B</a>text<sup>1</sup></td>'
+    cells = [
+        TableCell.from_soup(BeautifulSoup(html, "lxml").td),
+        TableCell(),
+        TableCell(text="A", sups=["1", "2"]),
+    ]
+    assert loads_cells(dumps_cells(cells)) == cells
+    assert loads_cells(dumps_cells([])) == []
+
+
+def test_shared_memory_round_trip() -> None:
+    """Tables can be handed over through shared memory by name."""
+
+    table = _scraped_table()
+    restored = load_shared_table(share_table(table))
+    assert restored.title == "Cartoons"
+    pd.testing.assert_frame_equal(restored, table)
+
+
+def test_pickle_keeps_dtypes_and_axis_names() -> None:
+    """Pickling a ``Table`` preserves dtypes, axis names and the title."""
+
+    table = Table(
+        {
+            "a": pd.Series(["x", "y"], dtype=object),
+            "b": pd.Series(["z", None], dtype=pd.StringDtype(na_value=pd.NA)),
+        },
+        title="Typed",
+    )
+    table.index.name = "row"
+    table.columns.name = "field"
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert isinstance(restored, Table)
+    assert restored.title == "Typed"
+    assert restored.index.name == "row"
+    assert restored.columns.name == "field"
+    pd.testing.assert_series_equal(restored.dtypes, table.dtypes)
+    pd.testing.assert_frame_equal(restored, table)